@@ -1,22 +1,25 @@
 """
 Web Server untuk Sistem Analisis Gadai
 Backend API dengan Flask
+
+pandas dan modul pipeline di-import secara lazy (saat request pertama
+yang membutuhkannya) agar cold start worker tetap cepat.
 """
 from flask import Flask, render_template, jsonify, request
 from flask_cors import CORS
-import pandas as pd
-from pathlib import Path
-from config import OUTPUT_DIR, PROCESSED_FILE, OUTLET_SUMMARY, INPUT_FILE
-from src.loader import load_and_normalize
-from src.processor import process_data
-from src.analyzer import analyze_data
-from src.reporter import save_reports
-import json
+from config import PROCESSED_FILE, OUTLET_SUMMARY
 from datetime import datetime
 
 app = Flask(__name__)
 CORS(app)
 
+
+def read_csv(path, **kwargs):
+    """Baca CSV dengan pandas (import lazy)"""
+    import pandas as pd
+    return pd.read_csv(path, **kwargs)
+
+
 # Route utama
 @app.route('/')
 def index():
@@ -28,10 +31,10 @@ def index():
 def get_summary():
     """Get statistik ringkasan"""
     try:
-        df = pd.read_csv(PROCESSED_FILE)
+        df = read_csv(PROCESSED_FILE)
         
-        # Hitung transaksi berisiko tinggi
-        transaksi_berisiko = int((df['kategori_risiko'] == 'tinggi').sum()) if 'kategori_risiko' in df.columns else 0
+        # Transaksi berisiko = is_high_risk (sama dengan outlet summary & CLI)
+        transaksi_berisiko = int(df['is_high_risk'].sum()) if 'is_high_risk' in df.columns else 0
         
         summary = {
             'total_transaksi': len(df),
@@ -39,7 +42,8 @@ def get_summary():
             'transaksi_berisiko': transaksi_berisiko,
             'persen_berisiko': round(transaksi_berisiko / len(df) * 100, 1) if len(df) > 0 else 0,
             'status_counts': df['status_transaksi'].value_counts().to_dict() if 'status_transaksi' in df.columns else {},
-            'risiko_counts': df['kategori_risiko'].value_counts().to_dict() if 'kategori_risiko' in df.columns else {},
+            'risiko_counts': df['is_high_risk'].map({True: 'tinggi', False: 'rendah'}).value_counts().to_dict() if 'is_high_risk' in df.columns else {},
+            'skor_model_counts': df['kategori_skor_model'].value_counts().to_dict() if 'kategori_skor_model' in df.columns else {},
             'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
         
@@ -52,7 +56,7 @@ def get_summary():
 def get_outlets():
     """Get data summary per outlet"""
     try:
-        df = pd.read_csv(OUTLET_SUMMARY)
+        df = read_csv(OUTLET_SUMMARY)
         
         # Convert to dict
         outlets = []
@@ -79,7 +83,7 @@ def get_top_outlets():
         limit = int(request.args.get('limit', 10))
         sort_by = request.args.get('sort', 'total_pinjaman')
         
-        df = pd.read_csv(OUTLET_SUMMARY)
+        df = read_csv(OUTLET_SUMMARY)
         df = df.sort_values(sort_by, ascending=False).head(limit)
         
         outlets = []
@@ -107,7 +111,7 @@ def get_transactions():
         per_page = int(request.args.get('per_page', 50))
         outlet = request.args.get('outlet', None)
         
-        df = pd.read_csv(PROCESSED_FILE)
+        df = read_csv(PROCESSED_FILE)
         
         # Filter by outlet if specified
         if outlet:
@@ -137,6 +141,13 @@ def get_transactions():
 @app.route('/api/analyze', methods=['POST'])
 def run_analysis():
     """Jalankan analisis ulang"""
+    from src.loader import load_and_normalize
+    from src.processor import process_data
+    from src.validator import validate_data
+    from src.scorer import score_transactions
+    from src.analyzer import analyze_data
+    from src.reporter import save_reports
+    
     try:
         # Load data
         df = load_and_normalize()
@@ -144,6 +155,12 @@ def run_analysis():
         # Process
         df, col_mapping = process_data(df)
         
+        # Validate
+        df, quality_report = validate_data(df, col_mapping)
+        
+        # Skor risiko model (hanya baris valid)
+        score_transactions(df, col_mapping)
+        
         # Analyze
         summary_status, outlet_summary = analyze_data(df, col_mapping)
         
@@ -166,7 +183,7 @@ def run_analysis():
 def get_status_chart():
     """Data untuk pie chart status"""
     try:
-        df = pd.read_csv(PROCESSED_FILE)
+        df = read_csv(PROCESSED_FILE)
         status_counts = df['status_transaksi'].value_counts()
         
         return jsonify({
@@ -181,7 +198,7 @@ def get_outlet_risk_chart():
     """Data untuk bar chart outlet berisiko"""
     try:
         limit = int(request.args.get('limit', 10))
-        df = pd.read_csv(OUTLET_SUMMARY)
+        df = read_csv(OUTLET_SUMMARY)
         df = df.sort_values('persen_berisiko', ascending=False).head(limit)
         
         return jsonify({
@@ -1,12 +1,13 @@
 """
 Konfigurasi Global untuk Sistem Analisis Gadai
 """
+import os
 from pathlib import Path
 
 # Path Project
 BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "data"
-OUTPUT_DIR = BASE_DIR / "output"
+OUTPUT_DIR = Path(os.environ.get("GADAI_OUTPUT_DIR", BASE_DIR / "output"))  # bisa di-override via env
 
 # File Input/Output
 INPUT_FILE = DATA_DIR / "gadai_raw.xlsx"
@@ -16,6 +17,13 @@ PROCESSED_FILE = OUTPUT_DIR / "gadai_processed.csv"
 OUTLET_SUMMARY = OUTPUT_DIR / "outlet_summary.csv"
 OUTLET_RISK = OUTPUT_DIR / "outlet_risk_summary.csv"
 SUMMARY_TEXT = OUTPUT_DIR / "summary.txt"
+STATUS_SUMMARY = OUTPUT_DIR / "status_summary.csv"
+QUARANTINE_FILE = OUTPUT_DIR / "gadai_quarantine.csv"
+QUALITY_REPORT = OUTPUT_DIR / "data_quality.csv"
+RISK_MODEL = OUTPUT_DIR / "risk_model.joblib"
+
+# Jumlah thread untuk menulis file laporan secara paralel
+REPORT_WORKERS = 4
 
 # Sheet Data Operasional
 DATA_SHEETS = ["Outstanding", "Active", "On-Due", "Late", "Auction"]
@@ -45,8 +53,17 @@ COLUMN_MAPPING = {
 RISK_THRESHOLD = {
     "rasio_pinjaman": 0.9,  # > 90% dianggap berisiko
     "late_ratio": 0.3,       # > 30% late dianggap outlet berisiko
-    "auction_ratio": 0.2     # > 20% auction dianggap outlet sangat berisiko
+    "auction_ratio": 0.2,    # > 20% auction dianggap outlet sangat berisiko
+    "skor_tinggi": 0.5,      # skor model >= 0.5 dianggap risiko tinggi
+    "skor_sedang": 0.25      # skor model >= 0.25 dianggap risiko sedang
 }
 
-# Ensure output directory exists
-OUTPUT_DIR.mkdir(exist_ok=True)
+# Model Skor Risiko
+RISK_LABEL_SHEETS = ["Late", "Auction"]  # Sheet yang dianggap outcome buruk (label 1)
+SCORING_BATCH_SIZE = 50_000              # Jumlah baris per batch predict_proba
+
+
+def ensure_output_dir():
+    """Buat folder output jika belum ada (dipanggil saat akan menulis file)"""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    return OUTPUT_DIR
@@ -7,23 +7,46 @@ Sistem terintegrasi untuk analisis data gadai
 Modul:
 1. Loader      - Load dan normalisasi data
 2. Processor   - Processing dan feature engineering  
-3. Analyzer    - Analisis dan agregasi
-4. Reporter    - Generate laporan
+3. Validator   - Validasi kualitas data dan karantina
+4. Analyzer    - Analisis dan agregasi
+5. Reporter    - Generate laporan
+
+Command:
+  python main.py [analyze]     - Jalankan pipeline lengkap (default)
+  python main.py train         - Latih ulang model skor risiko
+  python main.py report-only   - Buat ulang summary dari file agregat
+  python main.py serve         - Jalankan web dashboard
+  python main.py bench         - Ukur cold-start & throughput scoring
+
+Module berat (pandas, openpyxl, sklearn) di-import secara lazy per
+command, sehingga command non-analisis tetap cepat.
 
 Author: Big Data Team
 Date: 2026
 ========================================
 """
+import argparse
+import os
+import shutil
+import subprocess
 import sys
+import tempfile
+import time
 from datetime import datetime
-from src.loader import load_and_normalize
-from src.processor import process_data
-from src.analyzer import analyze_data
-from src.reporter import save_reports
+from pathlib import Path
 
+# Target cold-start untuk command non-analisis (ms)
+COLD_START_TARGET_MS = 200
 
-def main():
-    """Main entry point untuk sistem analisis gadai"""
+
+def run_analyze(args=None):
+    """Jalankan pipeline lengkap: load -> process -> validate -> analyze -> report"""
+    from src.loader import load_and_normalize
+    from src.processor import process_data
+    from src.validator import validate_data
+    from src.scorer import score_transactions
+    from src.analyzer import analyze_data
+    from src.reporter import save_reports
     
     print("\n" + "=" * 60)
     print("  SISTEM ANALISIS GADAI")
@@ -37,10 +60,16 @@ def main():
         # Step 2: Process data
         df, col_mapping = process_data(df)
         
-        # Step 3: Analyze data
+        # Step 3: Validate data
+        df, quality_report = validate_data(df, col_mapping)
+        
+        # Skor risiko model hanya untuk baris yang lolos validasi
+        score_transactions(df, col_mapping)
+        
+        # Step 4: Analyze data
         summary_status, outlet_summary = analyze_data(df, col_mapping)
         
-        # Step 4: Save reports
+        # Step 5: Save reports
         save_reports(df, summary_status, outlet_summary)
         
         # Summary akhir
@@ -49,7 +78,9 @@ def main():
         print("=" * 60)
         print(f"\nTotal data diproses  : {len(df):,} transaksi")
         print(f"Total outlet         : {df[col_mapping['outlet']].nunique()} outlet")
-        print(f"Transaksi berisiko   : {df['is_high_risk'].sum():,} ({df['is_high_risk'].sum()/len(df)*100:.1f}%)")
+        n_berisiko = int(df['is_high_risk'].sum())
+        persen_berisiko = n_berisiko / len(df) * 100 if len(df) > 0 else 0.0
+        print(f"Transaksi berisiko   : {n_berisiko:,} ({persen_berisiko:.1f}%)")
         print("\n")
         
         return 0
@@ -61,5 +92,161 @@ def main():
         return 1
 
 
+def run_train(args=None):
+    """Latih model skor risiko dari sheet operasional dan simpan artifact-nya"""
+    from src.utils import print_section
+    from src.scorer import train_model
+    
+    print_section("TRAINING MODEL RISIKO")
+    try:
+        return 0 if train_model() is not None else 1
+    except Exception as e:
+        print(f"\n✗ ERROR: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+def run_report_only(args=None):
+    """Buat ulang summary.txt dari file agregat tanpa membaca data transaksi"""
+    from src.reporter import regenerate_reports
+    
+    try:
+        regenerate_reports()
+        return 0
+    except Exception as e:
+        print(f"\n✗ ERROR: {str(e)}")
+        return 1
+
+
+def run_serve(args):
+    """Jalankan web dashboard Flask"""
+    from app import app
+    
+    app.run(debug=args.debug, host=args.host, port=args.port)
+    return 0
+
+
+def measure_cold_start(command, repeats, env=None):
+    """
+    Ukur waktu cold-start sebuah command (proses Python baru)
+    
+    Returns:
+        tuple: (waktu terbaik dalam milidetik, return code terakhir yang
+               bukan 0 atau 0 jika semua berhasil)
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = subprocess.run(command, cwd=Path(__file__).resolve().parent, env=env,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        best = min(best, (time.perf_counter() - start) * 1000)
+        if result.returncode != 0:
+            return best, result.returncode
+    return best, 0
+
+
+def run_bench(args):
+    """Benchmark cold-start command non-analisis dan throughput scoring"""
+    from config import OUTLET_SUMMARY, STATUS_SUMMARY, PROCESSED_FILE
+    
+    cases = {
+        "main.py --help": ([sys.executable, "main.py", "--help"], None),
+        "import app (serve)": ([sys.executable, "-c", "import app"], None),
+    }
+    
+    # report-only dijalankan di folder output sementara agar summary.txt asli tidak tertimpa
+    bench_dir = Path(tempfile.mkdtemp(prefix="gadai_bench_"))
+    missing_aggregates = [p.name for p in (OUTLET_SUMMARY, STATUS_SUMMARY) if not p.exists()]
+    if not missing_aggregates:
+        shutil.copy(OUTLET_SUMMARY, bench_dir)
+        shutil.copy(STATUS_SUMMARY, bench_dir)
+        env = {**os.environ, "GADAI_OUTPUT_DIR": str(bench_dir)}
+        cases["main.py report-only"] = ([sys.executable, "main.py", "report-only"], env)
+    
+    failed = False
+    print(f"\n✓ Cold-start (terbaik dari {args.repeats}x, target < {COLD_START_TARGET_MS} ms):")
+    try:
+        for name, (command, env) in cases.items():
+            ms, returncode = measure_cold_start(command, args.repeats, env=env)
+            if returncode != 0:
+                failed = True
+                print(f"  ✗ {name:22} : GAGAL (exit code {returncode})")
+                continue
+            status = "✓" if ms < COLD_START_TARGET_MS else "✗"
+            print(f"  {status} {name:22} : {ms:7.1f} ms")
+    finally:
+        shutil.rmtree(bench_dir, ignore_errors=True)
+    
+    if missing_aggregates:
+        print(f"  - {'main.py report-only':22} : DILEWATI ({', '.join(missing_aggregates)} belum ada, "
+              f"jalankan 'python main.py analyze' dulu)")
+    
+    if args.scoring:
+        if not PROCESSED_FILE.exists():
+            print(f"\n✗ {PROCESSED_FILE.name} belum ada, jalankan 'python main.py analyze' dulu")
+            return 1
+        
+        import pandas as pd
+        from src.processor import detect_columns, engineer_features
+        from src.scorer import benchmark_scoring, get_model
+        
+        df = pd.read_csv(PROCESSED_FILE)
+        col_mapping = detect_columns(df)
+        df = engineer_features(df, col_mapping)
+        
+        start = time.perf_counter()
+        artifact = get_model()
+        load_ms = (time.perf_counter() - start) * 1000
+        if artifact is None:
+            print("\n✗ Model tidak tersedia atau usang, jalankan 'python main.py train' dulu")
+            return 1
+        
+        print(f"\n✓ Muat model (joblib + import sklearn) : {load_ms:.1f} ms")
+        print(f"\n✓ Throughput scoring ({len(df):,} transaksi):")
+        for row in benchmark_scoring(df, col_mapping, artifact, repeats=args.repeats).itertuples(index=False):
+            print(f"  batch {row.batch_size:>7,} : {row.detik:6.3f} s ({row.baris_per_detik:,.0f} baris/detik)")
+    
+    return 1 if failed else 0
+
+
+def build_parser():
+    """Buat parser argumen CLI dengan subcommand"""
+    parser = argparse.ArgumentParser(description="Sistem Analisis Gadai")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    subparsers.add_parser("analyze", help="Jalankan pipeline analisis lengkap (default)")
+    subparsers.add_parser("train", help="Latih ulang model skor risiko")
+    subparsers.add_parser("report-only", help="Buat ulang summary dari file agregat")
+    
+    serve = subparsers.add_parser("serve", help="Jalankan web dashboard")
+    serve.add_argument("--host", default="0.0.0.0")
+    serve.add_argument("--port", type=int, default=5000)
+    serve.add_argument("--debug", action="store_true")
+    
+    bench = subparsers.add_parser("bench", help="Ukur cold-start dan throughput scoring")
+    bench.add_argument("--repeats", type=int, default=5)
+    bench.add_argument("--scoring", action="store_true",
+                       help="Ikut benchmark throughput scoring (butuh gadai_processed.csv)")
+    
+    return parser
+
+
+COMMANDS = {
+    None: run_analyze,
+    "analyze": run_analyze,
+    "train": run_train,
+    "report-only": run_report_only,
+    "serve": run_serve,
+    "bench": run_bench,
+}
+
+
+def main(argv=None):
+    """Main entry point untuk sistem analisis gadai"""
+    args = build_parser().parse_args(argv)
+    return COMMANDS[args.command](args)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -17,7 +17,7 @@ def analyze_data(df, col_mapping):
     Returns:
         tuple: (summary_status, outlet_summary)
     """
-    print_section("STEP 3: ANALYZING DATA")
+    print_section("STEP 4: ANALYZING DATA")
     
     # Summary status transaksi
     summary_status = df["status_transaksi"].value_counts()
@@ -32,7 +32,8 @@ def analyze_data(df, col_mapping):
             total_transaksi=(pinjaman_col, "count"),
             total_pinjaman=(pinjaman_col, "sum"),
             rata_rasio=("rasio_pinjaman", "mean"),
-            transaksi_berisiko=("is_high_risk", "sum")
+            transaksi_berisiko=("is_high_risk", "sum"),
+            rata_skor_risiko=("skor_risiko", "mean")
         )
     )
     
@@ -20,7 +20,41 @@ def process_data(df):
     """
     print_section("STEP 2: PROCESSING DATA")
     
-    # Auto-detect kolom penting (sudah dalam format normalized: lowercase + underscore)
+    col_mapping = detect_columns(df)
+    
+    print("\n✓ Kolom terdeteksi:")
+    for key, col in col_mapping.items():
+        status = "✓" if col else "✗"
+        print(f"  {status} {key:15} -> {col}")
+    
+    # Validasi kolom wajib
+    missing = [k for k, v in col_mapping.items() if v is None]
+    if missing:
+        print(f"\n✗ ERROR: Kolom tidak ditemukan: {missing}")
+        sys.exit(1)
+    
+    print("\n✓ Type casting...")
+    print("✓ Feature engineering...")
+    df = engineer_features(df, col_mapping)
+    
+    # Flag risiko
+    df["is_high_risk"] = df["rasio_pinjaman"] > RISK_THRESHOLD["rasio_pinjaman"]
+    
+    print("  ✓ Semua feature berhasil dibuat")
+    
+    return df, col_mapping
+
+
+def detect_columns(df):
+    """
+    Auto-detect kolom penting (sudah dalam format normalized: lowercase + underscore)
+    
+    Args:
+        df (pd.DataFrame): Data yang sudah dinormalisasi
+        
+    Returns:
+        dict: Mapping nama standar -> nama kolom (None jika tidak ditemukan)
+    """
     col_pinjaman = find_column(df, ["pokok_pinjaman", "pinjaman", "nilai_pinjam", "loan", "outstanding_pokok"])
     col_jaminan = find_column(df, ["nilai_jaminan", "jaminan_pokok", "pokok", "jaminan"])
     col_terbayar = find_column(df, ["pokok_terbayar", "terbayar"])
@@ -37,19 +71,21 @@ def process_data(df):
         "outlet": col_outlet,
     }
     
-    print("\n✓ Kolom terdeteksi:")
-    for key, col in col_mapping.items():
-        status = "✓" if col else "✗"
-        print(f"  {status} {key:15} -> {col}")
-    
-    # Validasi kolom wajib
-    missing = [k for k, v in col_mapping.items() if v is None]
-    if missing:
-        print(f"\n✗ ERROR: Kolom tidak ditemukan: {missing}")
-        sys.exit(1)
+    return col_mapping
+
+
+def engineer_features(df, col_mapping):
+    """
+    Type casting dan feature engineering dasar
     
+    Args:
+        df (pd.DataFrame): Data dengan kolom hasil detect_columns
+        col_mapping (dict): Mapping kolom
+        
+    Returns:
+        pd.DataFrame: Data dengan feature tambahan
+    """
     # Type casting
-    print("\n✓ Type casting...")
     df[col_mapping["tanggal"]] = pd.to_datetime(df[col_mapping["tanggal"]], errors='coerce')
     df[col_mapping["tanggal_jt"]] = pd.to_datetime(df[col_mapping["tanggal_jt"]], errors='coerce')
     df[col_mapping["pinjaman"]] = pd.to_numeric(df[col_mapping["pinjaman"]], errors='coerce')
@@ -57,7 +93,6 @@ def process_data(df):
     df[col_mapping["terbayar"]] = pd.to_numeric(df[col_mapping["terbayar"]], errors='coerce')
     
     # Feature engineering
-    print("✓ Feature engineering...")
     df["lama_gadai_hari"] = (df[col_mapping["tanggal_jt"]] - df[col_mapping["tanggal"]]).dt.days
     df["outstanding_pokok"] = df[col_mapping["jaminan"]] - df[col_mapping["terbayar"]]
     df["rasio_pinjaman"] = df[col_mapping["pinjaman"]] / df[col_mapping["jaminan"]]
@@ -68,9 +103,4 @@ def process_data(df):
     df.loc[df["outstanding_pokok"] <= 0, "status_transaksi"] = "lunas"
     df.loc[(df["outstanding_pokok"] > 0) & (df[col_mapping["tanggal_jt"]] < today), "status_transaksi"] = "lewat_jt"
     
-    # Flag risiko
-    df["is_high_risk"] = df["rasio_pinjaman"] > RISK_THRESHOLD["rasio_pinjaman"]
-    
-    print("  ✓ Semua feature berhasil dibuat")
-    
-    return df, col_mapping
+    return df
@@ -1,53 +1,140 @@
 """
 Report Generator Module
 Fungsi: Simpan hasil analisis ke file
+
+Modul ini tidak meng-import pandas di level modul, sehingga mode
+report-only (regenerate_reports) bisa berjalan tanpa biaya import pandas.
+Setiap file ditulis atomic (file sementara + rename) agar API tidak pernah
+membaca file yang setengah tertulis.
 """
-from config import PROCESSED_FILE, OUTLET_SUMMARY, SUMMARY_TEXT
-from src.utils import print_section
+import csv
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from config import (
+    PROCESSED_FILE, OUTLET_SUMMARY, STATUS_SUMMARY, SUMMARY_TEXT,
+    REPORT_WORKERS, ensure_output_dir,
+)
+from src.utils import atomic_path, print_section
 
 
 def save_reports(df, summary_status, outlet_summary):
     """
     Simpan semua hasil ke file
-    
+
     Args:
         df (pd.DataFrame): Data processed
         summary_status (pd.Series): Summary status transaksi
         outlet_summary (pd.DataFrame): Summary per outlet
     """
-    print_section("STEP 4: SAVING REPORTS")
-    
-    # Simpan data processed
-    df.to_csv(PROCESSED_FILE, index=False)
-    print(f"✓ Data processed    : {PROCESSED_FILE.name}")
-    
-    # Simpan outlet summary
+    print_section("STEP 5: SAVING REPORTS")
+    ensure_output_dir()
+
     outlet_summary_with_name = outlet_summary.reset_index()
-    outlet_summary_with_name.to_csv(OUTLET_SUMMARY, index=False)
-    print(f"✓ Outlet summary    : {OUTLET_SUMMARY.name}")
-    
-    # Simpan summary text
-    with open(SUMMARY_TEXT, "w", encoding="utf-8") as f:
+    status_summary = summary_status.rename_axis("status_transaksi").rename("jumlah")
+    outlets = list(zip(
+        outlet_summary.index,
+        outlet_summary["total_pinjaman"].tolist(),
+        outlet_summary["persen_berisiko"].tolist(),
+    ))
+
+    # Writer I/O-bound dijalankan paralel; CSV data processed biasanya paling lama
+    writers = [
+        ("Data processed", PROCESSED_FILE, lambda tmp: df.to_csv(tmp, index=False)),
+        ("Outlet summary", OUTLET_SUMMARY, lambda tmp: outlet_summary_with_name.to_csv(tmp, index=False)),
+        ("Status summary", STATUS_SUMMARY, lambda tmp: status_summary.to_csv(tmp)),
+        ("Summary text", SUMMARY_TEXT, lambda tmp: write_summary_text(list(summary_status.items()), outlets, tmp)),
+    ]
+    run_writers(writers)
+
+    print(f"\n✓ Semua laporan tersimpan di folder: {PROCESSED_FILE.parent.name}/")
+
+
+def write_atomic(path, write_fn):
+    """
+    Tulis file melalui file sementara lalu rename ke path tujuan
+
+    Args:
+        path (Path): File tujuan
+        write_fn (callable): Fungsi yang menulis ke path sementara
+    """
+    with atomic_path(path) as tmp:
+        write_fn(tmp)
+
+
+def run_writers(writers):
+    """
+    Jalankan writer secara paralel (thread pool) dan cetak hasil sesuai urutan
+
+    Args:
+        writers (list): List (label, path, write_fn)
+    """
+    with ThreadPoolExecutor(max_workers=min(REPORT_WORKERS, len(writers))) as pool:
+        futures = [pool.submit(write_atomic, path, write_fn) for _, path, write_fn in writers]
+        for (label, path, _), future in zip(writers, futures):
+            future.result()
+            print(f"✓ {label:18}: {path.name}")
+
+
+def write_summary_text(status_counts, outlets, path=SUMMARY_TEXT):
+    """
+    Tulis summary text dari data agregat
+
+    Args:
+        status_counts (list): List (status, jumlah)
+        outlets (list): List (outlet, total_pinjaman, persen_berisiko)
+        path (Path): File tujuan
+    """
+    total_status = sum(count for _, count in status_counts)
+    top_pinjaman = heapq.nlargest(10, outlets, key=lambda o: o[1])
+    top_risk = heapq.nlargest(10, outlets, key=lambda o: o[2])
+
+    with open(path, "w", encoding="utf-8") as f:
         f.write("=" * 60 + "\n")
         f.write("  RINGKASAN ANALISIS GADAI\n")
         f.write("=" * 60 + "\n\n")
-        
+
         f.write("STATUS TRANSAKSI\n")
         f.write("-" * 40 + "\n")
-        for status, count in summary_status.items():
-            pct = count / summary_status.sum() * 100
+        for status, count in status_counts:
+            pct = count / total_status * 100
             f.write(f"{status:12} : {count:6,} ({pct:5.1f}%)\n")
-        
+
         f.write("\n\nTOP 10 OUTLET (Total Pinjaman)\n")
         f.write("-" * 40 + "\n")
-        for idx, row in outlet_summary.head(10).iterrows():
-            f.write(f"{idx:30} : Rp {row['total_pinjaman']:15,.0f}\n")
-        
+        for outlet, total_pinjaman, _ in top_pinjaman:
+            f.write(f"{outlet:30} : Rp {total_pinjaman:15,.0f}\n")
+
         f.write("\n\nTOP 10 OUTLET BERISIKO (% Transaksi High Risk)\n")
         f.write("-" * 40 + "\n")
-        top_risk = outlet_summary.sort_values("persen_berisiko", ascending=False).head(10)
-        for idx, row in top_risk.iterrows():
-            f.write(f"{idx:30} : {row['persen_berisiko']:5.1f}%\n")
-    
-    print(f"✓ Summary text      : {SUMMARY_TEXT.name}")
-    print(f"\n✓ Semua laporan tersimpan di folder: {PROCESSED_FILE.parent.name}/")
+        for outlet, _, persen_berisiko in top_risk:
+            f.write(f"{outlet:30} : {persen_berisiko:5.1f}%\n")
+
+
+def regenerate_reports():
+    """
+    Mode report-only: buat ulang summary.txt dari file agregat yang
+    sudah tersimpan (status_summary.csv & outlet_summary.csv), tanpa
+    membaca data transaksi
+    """
+    print_section("REPORT-ONLY: REGENERATE SUMMARY")
+
+    missing = [p.name for p in (STATUS_SUMMARY, OUTLET_SUMMARY) if not p.exists()]
+    if missing:
+        raise FileNotFoundError(
+            f"File agregat tidak ditemukan: {missing}. Jalankan 'python main.py analyze' dulu."
+        )
+
+    with open(STATUS_SUMMARY, newline="", encoding="utf-8") as f:
+        status_counts = [(row["status_transaksi"], int(row["jumlah"])) for row in csv.DictReader(f)]
+
+    with open(OUTLET_SUMMARY, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        outlet_col = reader.fieldnames[0]
+        outlets = [
+            (row[outlet_col], float(row["total_pinjaman"]), float(row["persen_berisiko"]))
+            for row in reader
+        ]
+
+    run_writers([
+        ("Summary text", SUMMARY_TEXT, lambda tmp: write_summary_text(status_counts, outlets, tmp)),
+    ])
@@ -0,0 +1,298 @@
+"""
+Risk Scorer Module
+Fungsi: Training, caching, dan scoring model risiko transaksi
+"""
+import time
+import numpy as np
+import pandas as pd
+from config import (
+    INPUT_FILE, RISK_MODEL, DATA_SHEETS, STATUS_PRIORITY,
+    RISK_LABEL_SHEETS, RISK_THRESHOLD, SCORING_BATCH_SIZE, ensure_output_dir,
+)
+from src.utils import atomic_path, normalize_columns
+
+# Urutan feature yang dipakai model (disimpan bersama artifact)
+MODEL_FEATURES = [
+    "rasio_pinjaman",
+    "lama_gadai_hari",
+    "persen_outstanding",
+    "log_pinjaman",
+]
+
+# Porsi data training yang disisihkan untuk evaluasi (holdout)
+HOLDOUT_SIZE = 0.2
+
+# Cache model di memory: {"artifact", "model_mtime"}; staleness terhadap
+# file input dicek ulang setiap get_model() dipanggil
+_model_cache = None
+
+
+def build_feature_matrix(df, col_mapping):
+    """
+    Bangun matrix feature (float64) untuk model secara vectorized
+
+    Args:
+        df (pd.DataFrame): Data yang sudah melalui engineer_features
+        col_mapping (dict): Mapping kolom
+
+    Returns:
+        np.ndarray: Matrix (n_baris, len(MODEL_FEATURES)); NaN dibiarkan,
+                    inf diubah menjadi NaN
+    """
+    jaminan = df[col_mapping["jaminan"]]
+
+    features = pd.DataFrame({
+        "rasio_pinjaman": df["rasio_pinjaman"],
+        "lama_gadai_hari": df["lama_gadai_hari"],
+        "persen_outstanding": df["outstanding_pokok"] / jaminan,
+        "log_pinjaman": np.log1p(df[col_mapping["pinjaman"]].clip(lower=0)),
+    }, index=df.index)
+
+    X = features[MODEL_FEATURES].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    X[~np.isfinite(X)] = np.nan
+    return X
+
+
+def load_training_data():
+    """
+    Load data historis dari semua sheet operasional sebagai data training
+
+    Label = 1 untuk transaksi di sheet RISK_LABEL_SHEETS (Late/Auction),
+    0 untuk lainnya. Transaksi yang muncul di beberapa sheet hanya diambil
+    status dengan prioritas tertinggi (STATUS_PRIORITY); baris tanpa sbg
+    tidak ikut deduplikasi.
+
+    Returns:
+        tuple: (X, y) atau None jika data training tidak tersedia
+    """
+    # Import di sini untuk menghindari circular import dengan processor
+    from src.processor import detect_columns, engineer_features
+
+    if not INPUT_FILE.exists():
+        return None
+
+    available = pd.ExcelFile(INPUT_FILE).sheet_names
+    sheets = [s for s in DATA_SHEETS if s in available]
+    if not sheets:
+        return None
+
+    frames = []
+    for sheet, data in pd.read_excel(INPUT_FILE, sheet_name=sheets).items():
+        data.columns = normalize_columns(data.columns.astype(str))
+        data["sheet_status"] = sheet
+        frames.append(data)
+    df = pd.concat(frames, ignore_index=True)
+
+    if "sbg" in df.columns:
+        has_sbg = df["sbg"].notna()
+        deduped = (
+            df[has_sbg]
+            .assign(_prioritas=df["sheet_status"].map(STATUS_PRIORITY))
+            .sort_values("_prioritas", ascending=False)
+            .drop_duplicates(subset="sbg", keep="first")
+            .drop(columns="_prioritas")
+        )
+        df = pd.concat([deduped, df[~has_sbg]], ignore_index=True)
+
+    col_mapping = detect_columns(df)
+    if any(v is None for v in col_mapping.values()):
+        return None
+
+    df = engineer_features(df, col_mapping)
+    X = build_feature_matrix(df, col_mapping)
+    y = df["sheet_status"].isin(RISK_LABEL_SHEETS).to_numpy(dtype=np.int8)
+    return X, y
+
+
+def train_model():
+    """
+    Training model risiko dan simpan ke RISK_MODEL dengan joblib
+
+    Model di-fit pada data training dan dievaluasi pada holdout
+    (HOLDOUT_SIZE, stratified); metrik holdout disimpan di artifact.
+
+    Returns:
+        dict: Artifact model ({"model", "features", "metrics", "trained_at"})
+              atau None
+    """
+    import joblib
+    from sklearn.ensemble import HistGradientBoostingClassifier
+    from sklearn.metrics import log_loss, roc_auc_score
+    from sklearn.model_selection import train_test_split
+
+    data = load_training_data()
+    if data is None:
+        print("  ⚠ Data training (sheet Late/Auction) tidak tersedia")
+        return None
+
+    X, y = data
+    if len(np.unique(y)) < 2:
+        print("  ⚠ Label training hanya satu kelas, model tidak dilatih")
+        return None
+
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=HOLDOUT_SIZE, stratify=y, random_state=42
+    )
+
+    model = HistGradientBoostingClassifier(max_iter=200, random_state=42)
+    model.fit(X_train, y_train)
+
+    proba_test = model.predict_proba(X_test)[:, 1]
+    metrics = {
+        "auc": float(roc_auc_score(y_test, proba_test)),
+        "log_loss": float(log_loss(y_test, proba_test)),
+        "n_train": int(len(y_train)),
+        "n_test": int(len(y_test)),
+    }
+
+    artifact = {
+        "model": model,
+        "features": list(MODEL_FEATURES),
+        "metrics": metrics,
+        "trained_at": pd.Timestamp.now().isoformat(timespec="seconds"),
+    }
+    ensure_output_dir()
+    with atomic_path(RISK_MODEL) as tmp:
+        joblib.dump(artifact, tmp)
+    print(f"  ✓ Model dilatih ({len(y):,} baris, {y.mean() * 100:.1f}% berisiko) -> {RISK_MODEL.name}")
+    print(f"  ✓ Holdout ({metrics['n_test']:,} baris): AUC {metrics['auc']:.3f}, log-loss {metrics['log_loss']:.4f}")
+
+    return artifact
+
+
+def load_model():
+    """
+    Load artifact model dari RISK_MODEL tanpa cache
+
+    Returns:
+        dict: Artifact model atau None jika file tidak ada atau daftar
+              feature-nya berbeda dengan MODEL_FEATURES
+    """
+    import joblib
+
+    if not RISK_MODEL.exists():
+        return None
+
+    artifact = joblib.load(RISK_MODEL)
+    if artifact.get("features") != MODEL_FEATURES:
+        print("  ⚠ Feature model berbeda dengan MODEL_FEATURES, jalankan 'python main.py train'")
+        return None
+    return artifact
+
+
+def _mtime(path):
+    """mtime file, atau None jika file tidak ada"""
+    return path.stat().st_mtime if path.exists() else None
+
+
+def get_model():
+    """
+    Ambil model secara lazy dengan cache di memory
+
+    Staleness dicek setiap pemanggilan: artifact di-load ulang jika file
+    model berubah, dan model yang lebih lama dari file input tidak dipakai
+    (jalankan 'python main.py train'). Fungsi ini tidak pernah melatih model.
+
+    Returns:
+        dict: Artifact model atau None jika tidak tersedia / usang
+    """
+    global _model_cache
+    model_mtime = _mtime(RISK_MODEL)
+    input_mtime = _mtime(INPUT_FILE)
+
+    if model_mtime is None:
+        _model_cache = None
+        return None
+
+    if _model_cache is None or _model_cache["model_mtime"] != model_mtime:
+        _model_cache = {"artifact": load_model(), "model_mtime": model_mtime}
+
+    if input_mtime is not None and model_mtime < input_mtime:
+        print("  ⚠ Model lebih lama dari file input, jalankan 'python main.py train'")
+        return None
+
+    return _model_cache["artifact"]
+
+
+def predict_batched(model, X, batch_size=SCORING_BATCH_SIZE):
+    """
+    Hitung probabilitas kelas berisiko dengan predict_proba per batch
+
+    Args:
+        model: Classifier yang sudah dilatih
+        X (np.ndarray): Matrix feature
+        batch_size (int): Jumlah baris per batch
+
+    Returns:
+        np.ndarray: Probabilitas berisiko per baris
+    """
+    proba = np.empty(len(X), dtype=np.float64)
+    for start in range(0, len(X), batch_size):
+        stop = start + batch_size
+        proba[start:stop] = model.predict_proba(X[start:stop])[:, 1]
+    return proba
+
+
+def score_transactions(df, col_mapping):
+    """
+    Tambahkan kolom skor_risiko dan kategori_skor_model ke data (in-place)
+
+    Kolom ini informatif saja; definisi "transaksi berisiko" di laporan dan
+    dashboard tetap is_high_risk (rasio_pinjaman > threshold).
+
+    Args:
+        df (pd.DataFrame): Data yang sudah melalui engineer_features
+        col_mapping (dict): Mapping kolom
+    """
+    artifact = get_model()
+    if artifact is None:
+        print("\n⚠ Model risiko tidak tersedia, skor_risiko dilewati ('python main.py train')")
+        df["skor_risiko"] = np.nan
+        df["kategori_skor_model"] = pd.NA
+        return
+
+    start = time.perf_counter()
+    X = build_feature_matrix(df, col_mapping)
+    skor = predict_batched(artifact["model"], X)
+    elapsed = time.perf_counter() - start
+
+    df["skor_risiko"] = skor
+    df["kategori_skor_model"] = np.select(
+        [skor >= RISK_THRESHOLD["skor_tinggi"], skor >= RISK_THRESHOLD["skor_sedang"]],
+        ["tinggi", "sedang"],
+        default="rendah",
+    )
+
+    rate = len(df) / elapsed if elapsed > 0 else float("inf")
+    print(f"\n✓ Skor risiko model : {len(df):,} transaksi ({rate:,.0f} baris/detik)")
+
+
+def benchmark_scoring(df, col_mapping, artifact, batch_sizes=(10_000, 50_000, 200_000), repeats=3):
+    """
+    Ukur throughput scoring (feature + predict_proba) untuk beberapa batch size
+
+    Args:
+        df (pd.DataFrame): Data yang sudah melalui engineer_features
+        col_mapping (dict): Mapping kolom
+        artifact (dict): Artifact model dari get_model()
+        batch_sizes (tuple): Batch size yang diuji
+        repeats (int): Jumlah pengulangan, diambil waktu terbaik
+
+    Returns:
+        pd.DataFrame: Hasil benchmark per batch size
+    """
+    results = []
+    for batch_size in batch_sizes:
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            X = build_feature_matrix(df, col_mapping)
+            predict_batched(artifact["model"], X, batch_size=batch_size)
+            best = min(best, time.perf_counter() - start)
+        results.append({
+            "batch_size": batch_size,
+            "detik": best,
+            "baris_per_detik": len(df) / best if best > 0 else float("inf"),
+        })
+
+    return pd.DataFrame(results)
@@ -1,8 +1,17 @@
 """
 Utility functions for data processing
+
+pandas di-import secara lazy di dalam fungsi agar modul ini (dan
+print_section) bisa dipakai oleh command ringan tanpa biaya import pandas.
 """
-import pandas as pd
-from typing import Optional
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def normalize_columns(columns):
@@ -10,7 +19,7 @@ def normalize_columns(columns):
     return columns.str.lower().str.replace(' ', '_')
 
 
-def find_column(df: pd.DataFrame, possible_names: list) -> Optional[str]:
+def find_column(df: "pd.DataFrame", possible_names: list) -> Optional[str]:
     """Find column name from possible variations"""
     for name in possible_names:
         if name in df.columns:
@@ -20,6 +29,7 @@ def find_column(df: pd.DataFrame, possible_names: list) -> Optional[str]:
 
 def clean_numeric(value):
     """Clean and convert value to numeric"""
+    import pandas as pd
     if pd.isna(value):
         return None
     if isinstance(value, (int, float)):
@@ -36,6 +46,7 @@ def clean_numeric(value):
 
 def clean_datetime(value):
     """Clean and convert value to datetime"""
+    import pandas as pd
     if pd.isna(value):
         return None
     try:
@@ -51,7 +62,7 @@ def print_section(title: str, char: str = "="):
     print(f"{char * 80}\n")
 
 
-def print_stats(df: pd.DataFrame, title: str = "Dataset Statistics"):
+def print_stats(df: "pd.DataFrame", title: str = "Dataset Statistics"):
     """Print basic statistics about a dataframe"""
     print_section(title)
     print(f"Total Rows: {len(df):,}")
@@ -60,3 +71,20 @@ def print_stats(df: pd.DataFrame, title: str = "Dataset Statistics"):
     for i, col in enumerate(df.columns, 1):
         print(f"  {i}. {col}")
     print(f"\nMemory Usage: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+
+
+@contextmanager
+def atomic_path(path):
+    """
+    Yield path sementara di folder yang sama; setelah blok selesai tanpa error
+    file di-rename (os.replace) ke path tujuan, sehingga pembaca tidak pernah
+    melihat file yang setengah tertulis
+    """
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
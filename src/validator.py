@@ -0,0 +1,112 @@
+"""
+Data Validator Module
+Fungsi: Validasi kualitas data dan karantina baris yang tidak valid
+"""
+import numpy as np
+import pandas as pd
+from config import QUARANTINE_FILE, QUALITY_REPORT, ensure_output_dir
+from src.utils import atomic_path, print_section
+
+
+def build_rule_masks(df, col_mapping):
+    """
+    Evaluasi semua aturan validasi secara vectorized (satu pass)
+
+    Args:
+        df (pd.DataFrame): Data yang sudah di-type casting
+        col_mapping (dict): Mapping kolom
+
+    Returns:
+        tuple: (masks, rule_columns) - DataFrame boolean per aturan
+               dan mapping kode aturan -> kolom yang diperiksa
+    """
+    pinjaman = df[col_mapping["pinjaman"]]
+    jaminan = df[col_mapping["jaminan"]]
+    terbayar = df[col_mapping["terbayar"]]
+    tanggal = df[col_mapping["tanggal"]]
+    tanggal_jt = df[col_mapping["tanggal_jt"]]
+    outlet = df[col_mapping["outlet"]]
+
+    rules = {
+        "outlet_kosong": ("outlet", outlet.isna()),
+        "tanggal_kosong": ("tanggal", tanggal.isna()),
+        "tanggal_jt_kosong": ("tanggal_jt", tanggal_jt.isna()),
+        "jt_sebelum_tanggal": ("tanggal_jt", tanggal_jt < tanggal),
+        "pinjaman_kosong": ("pinjaman", pinjaman.isna()),
+        "pinjaman_negatif": ("pinjaman", pinjaman < 0),
+        "jaminan_kosong": ("jaminan", jaminan.isna()),
+        "jaminan_nol": ("jaminan", jaminan <= 0),
+        "terbayar_kosong": ("terbayar", terbayar.isna()),
+        "terbayar_negatif": ("terbayar", terbayar < 0),
+    }
+    if "rasio_pinjaman" in df.columns:
+        rasio = df["rasio_pinjaman"].to_numpy(dtype=float, na_value=np.nan)
+        rules["rasio_tidak_valid"] = ("rasio_pinjaman", pd.Series(~np.isfinite(rasio), index=df.index))
+
+    masks = pd.DataFrame({code: mask for code, (_, mask) in rules.items()}, index=df.index)
+    rule_columns = {code: col for code, (col, _) in rules.items()}
+
+    return masks, rule_columns
+
+
+def validate_data(df, col_mapping):
+    """
+    Validasi data, simpan baris bermasalah ke file karantina
+
+    Args:
+        df (pd.DataFrame): Data yang sudah diproses
+        col_mapping (dict): Mapping kolom
+
+    Returns:
+        tuple: (df_valid, quality_report) - quality_report berisi satu baris
+               per aturan (tingkat="aturan") dan satu baris per kolom
+               (tingkat="kolom", jumlah baris unik yang melanggar aturan
+               apa pun pada kolom tersebut)
+    """
+    print_section("STEP 3: VALIDATING DATA")
+
+    masks, rule_columns = build_rule_masks(df, col_mapping)
+    is_invalid = masks.any(axis=1)
+
+    # Counter kualitas per aturan, lalu per kolom (baris unik, tidak double count)
+    rule_counts = masks.sum()
+    column_counts = masks.T.groupby(rule_columns, sort=False).any().T.sum()
+    quality_report = pd.DataFrame({
+        "tingkat": ["aturan"] * len(rule_counts) + ["kolom"] * len(column_counts),
+        "aturan": list(rule_counts.index) + ["semua_aturan"] * len(column_counts),
+        "kolom": [rule_columns[code] for code in rule_counts.index] + list(column_counts.index),
+        "jumlah_baris": np.concatenate([rule_counts.to_numpy(), column_counts.to_numpy()]),
+    })
+    quality_report["persen"] = quality_report["jumlah_baris"] / len(df) * 100 if len(df) > 0 else 0.0
+
+    # Kode alasan hanya dibangun untuk baris yang gagal validasi
+    invalid_masks = masks[is_invalid]
+    reasons = pd.Series("", index=invalid_masks.index, dtype=object)
+    for code in invalid_masks.columns:
+        reasons[invalid_masks[code]] += code + ";"
+
+    quarantine = df[is_invalid].copy()
+    quarantine["alasan_karantina"] = reasons.str.rstrip(";")
+
+    ensure_output_dir()
+    with atomic_path(QUARANTINE_FILE) as tmp:
+        quarantine.to_csv(tmp, index=False)
+    with atomic_path(QUALITY_REPORT) as tmp:
+        quality_report.to_csv(tmp, index=False)
+
+    print("✓ Kualitas data per aturan:")
+    for row in quality_report[quality_report["tingkat"] == "aturan"].itertuples(index=False):
+        status = "✓" if row.jumlah_baris == 0 else "✗"
+        print(f"  {status} {row.aturan:20} ({row.kolom:15}) : {row.jumlah_baris:6,} ({row.persen:5.1f}%)")
+
+    print("\n✓ Kualitas data per kolom (baris unik):")
+    for row in quality_report[quality_report["tingkat"] == "kolom"].itertuples(index=False):
+        status = "✓" if row.jumlah_baris == 0 else "✗"
+        print(f"  {status} {row.kolom:20} : {row.jumlah_baris:6,} ({row.persen:5.1f}%)")
+
+    n_invalid = int(is_invalid.sum())
+    print(f"\n✓ Baris valid       : {len(df) - n_invalid:,}")
+    print(f"✓ Baris dikarantina : {n_invalid:,} -> {QUARANTINE_FILE.name}")
+    print(f"✓ Laporan kualitas  : {QUALITY_REPORT.name}")
+
+    return df[~is_invalid].copy(), quality_report
@@ -0,0 +1,19 @@
+import pandas as pd
+import pytest
+
+from src.processor import detect_columns, engineer_features
+
+
+@pytest.fixture
+def gadai_df():
+    """Data gadai sintetis yang sudah melalui type casting + feature engineering"""
+    df = pd.DataFrame({
+        "outlet": ["A", "A", "B", None],
+        "tanggal": ["2025-01-01", "2025-02-01", "2025-03-01", "2025-04-01"],
+        "tanggal_jt": ["2025-05-01", "2025-06-01", None, "2025-08-01"],
+        "pokok_pinjaman": [800_000, 900_000, 500_000, 400_000],
+        "nilai_jaminan": [1_000_000, 0, 600_000, 500_000],
+        "pokok_terbayar": [100_000, 0, 0, 0],
+    })
+    col_mapping = detect_columns(df)
+    return engineer_features(df, col_mapping), col_mapping
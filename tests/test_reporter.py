@@ -0,0 +1,70 @@
+import pandas as pd
+import pytest
+
+import src.reporter as reporter
+from src.utils import atomic_path
+
+
+@pytest.fixture
+def tmp_output(tmp_path, monkeypatch):
+    for name, filename in [
+        ("PROCESSED_FILE", "gadai_processed.csv"),
+        ("OUTLET_SUMMARY", "outlet_summary.csv"),
+        ("STATUS_SUMMARY", "status_summary.csv"),
+        ("SUMMARY_TEXT", "summary.txt"),
+    ]:
+        monkeypatch.setattr(reporter, name, tmp_path / filename)
+    monkeypatch.setattr(reporter, "ensure_output_dir", lambda: tmp_path)
+    return tmp_path
+
+
+def test_atomic_path_replaces_on_success(tmp_path):
+    target = tmp_path / "hasil.txt"
+    target.write_text("lama")
+
+    with atomic_path(target) as tmp:
+        tmp.write_text("baru")
+        assert target.read_text() == "lama"
+
+    assert target.read_text() == "baru"
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_atomic_path_cleans_up_on_failure(tmp_path):
+    target = tmp_path / "hasil.txt"
+    target.write_text("lama")
+
+    with pytest.raises(ValueError):
+        with atomic_path(target) as tmp:
+            tmp.write_text("setengah")
+            raise ValueError("gagal")
+
+    assert target.read_text() == "lama"
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_regenerate_reports_matches_save_reports(tmp_output):
+    df = pd.DataFrame({"outlet": ["A", "B", "C"], "status_transaksi": ["aktif", "lunas", "aktif"]})
+    summary_status = df["status_transaksi"].value_counts()
+    outlet_summary = pd.DataFrame(
+        {
+            "total_pinjaman": [3_000_000.0, 2_000_000.0, 1_000_000.0],
+            "persen_berisiko": [10.0, 50.0, 25.0],
+        },
+        index=pd.Index(["A", "B", "C"], name="outlet"),
+    )
+
+    reporter.save_reports(df, summary_status, outlet_summary)
+    original = (tmp_output / "summary.txt").read_text(encoding="utf-8")
+    (tmp_output / "summary.txt").unlink()
+
+    reporter.regenerate_reports()
+
+    assert (tmp_output / "summary.txt").read_text(encoding="utf-8") == original
+    risk_section = original.split("BERISIKO")[1]
+    assert risk_section.index("B ") < risk_section.index("C ") < risk_section.index("A ")
+
+
+def test_regenerate_reports_requires_aggregates(tmp_output):
+    with pytest.raises(FileNotFoundError):
+        reporter.regenerate_reports()
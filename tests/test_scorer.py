@@ -0,0 +1,95 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.scorer as scorer
+
+
+def make_workbook(path, n=200):
+    """Workbook sintetis dengan sheet Active (label 0) dan Late (label 1)"""
+    rng = np.random.default_rng(0)
+    jaminan = rng.integers(1, 10, n) * 1_000_000
+    df = pd.DataFrame({
+        "sbg": [f"SBG{i}" for i in range(n)],
+        "outlet": rng.choice(["A", "B"], n),
+        "tanggal": pd.Timestamp("2025-01-01") + pd.to_timedelta(rng.integers(0, 300, n), unit="D"),
+        "pokok_pinjaman": jaminan * rng.uniform(0.5, 1.0, n),
+        "nilai_jaminan": jaminan,
+        "pokok_terbayar": jaminan * rng.uniform(0, 0.5, n),
+    })
+    df["tanggal_jt"] = df["tanggal"] + pd.Timedelta(days=120)
+    late = df["pokok_pinjaman"] / df["nilai_jaminan"] > 0.8
+    with pd.ExcelWriter(path) as writer:
+        df[~late].to_excel(writer, sheet_name="Active", index=False)
+        df[late].to_excel(writer, sheet_name="Late", index=False)
+    return df
+
+
+@pytest.fixture
+def workbook(tmp_path, monkeypatch):
+    path = tmp_path / "gadai_raw.xlsx"
+    make_workbook(path)
+    monkeypatch.setattr(scorer, "INPUT_FILE", path)
+    monkeypatch.setattr(scorer, "RISK_MODEL", tmp_path / "risk_model.joblib")
+    monkeypatch.setattr(scorer, "ensure_output_dir", lambda: tmp_path)
+    monkeypatch.setattr(scorer, "_model_cache", None)
+    return path
+
+
+def test_get_model_does_not_train(workbook):
+    assert scorer.get_model() is None
+    assert not scorer.RISK_MODEL.exists()
+
+
+def test_train_model_stores_holdout_metrics(workbook):
+    artifact = scorer.train_model()
+
+    assert artifact["features"] == scorer.MODEL_FEATURES
+    assert 0.0 <= artifact["metrics"]["auc"] <= 1.0
+    assert artifact["metrics"]["n_test"] > 0
+    assert scorer.RISK_MODEL.exists()
+
+
+def test_get_model_rechecks_staleness_every_call(workbook):
+    scorer.train_model()
+    first = scorer.get_model()
+    assert first is not None
+
+    # File input diperbarui setelah model dilatih -> model usang
+    newer = scorer.RISK_MODEL.stat().st_mtime + 10
+    os.utime(workbook, (newer, newer))
+    assert scorer.get_model() is None
+
+    # Setelah training ulang, artifact baru di-load dari disk
+    scorer.train_model()
+    os.utime(scorer.RISK_MODEL, (newer + 10, newer + 10))
+    second = scorer.get_model()
+    assert second is not None and second is not first
+
+
+def test_load_training_data_keeps_rows_without_sbg(tmp_path, monkeypatch):
+    path = tmp_path / "gadai_raw.xlsx"
+    df = make_workbook(path, n=20)
+    df.loc[:4, "sbg"] = None
+    with pd.ExcelWriter(path) as writer:
+        df.to_excel(writer, sheet_name="Active", index=False)
+        df.head(10).to_excel(writer, sheet_name="Late", index=False)
+    monkeypatch.setattr(scorer, "INPUT_FILE", path)
+
+    X, y = scorer.load_training_data()
+
+    # 15 sbg unik (Late menang untuk 5 sbg duplikat) + 2x5 baris tanpa sbg
+    assert len(y) == 25
+    assert y.sum() == 10
+
+
+def test_benchmark_scoring_uses_given_artifact(workbook, gadai_df):
+    df, col_mapping = gadai_df
+    artifact = scorer.train_model()
+
+    result = scorer.benchmark_scoring(df, col_mapping, artifact, batch_sizes=(2,), repeats=1)
+
+    assert result["batch_size"].tolist() == [2]
+    assert (result["baris_per_detik"] > 0).all()
@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+import src.validator as validator
+
+
+@pytest.fixture(autouse=True)
+def tmp_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(validator, "QUARANTINE_FILE", tmp_path / "gadai_quarantine.csv")
+    monkeypatch.setattr(validator, "QUALITY_REPORT", tmp_path / "data_quality.csv")
+    monkeypatch.setattr(validator, "ensure_output_dir", lambda: tmp_path)
+    return tmp_path
+
+
+def test_build_rule_masks_flags_each_rule(gadai_df):
+    df, col_mapping = gadai_df
+    masks, rule_columns = validator.build_rule_masks(df, col_mapping)
+
+    assert masks.index.equals(df.index)
+    assert masks["jaminan_nol"].tolist() == [False, True, False, False]
+    assert masks["rasio_tidak_valid"].tolist() == [False, True, False, False]
+    assert masks["tanggal_jt_kosong"].tolist() == [False, False, True, False]
+    assert masks["outlet_kosong"].tolist() == [False, False, False, True]
+    assert rule_columns["jaminan_nol"] == "jaminan"
+
+
+def test_validate_data_quarantines_with_reason_codes(gadai_df, tmp_output):
+    df, col_mapping = gadai_df
+    valid, quality_report = validator.validate_data(df, col_mapping)
+
+    assert valid.index.tolist() == [0]
+
+    quarantine = pd.read_csv(tmp_output / "gadai_quarantine.csv")
+    assert quarantine["alasan_karantina"].tolist() == [
+        "jaminan_nol;rasio_tidak_valid",
+        "tanggal_jt_kosong",
+        "outlet_kosong",
+    ]
+
+    per_rule = quality_report[quality_report["tingkat"] == "aturan"].set_index("aturan")["jumlah_baris"]
+    assert per_rule["jaminan_nol"] == 1
+    assert per_rule["pinjaman_kosong"] == 0
+    assert (tmp_output / "data_quality.csv").exists()
+
+
+def test_validate_data_all_rows_invalid(gadai_df):
+    df, col_mapping = gadai_df
+    df[col_mapping["jaminan"]] = 0
+
+    valid, _ = validator.validate_data(df, col_mapping)
+
+    assert valid.empty
+
+
+def test_validate_data_counts_distinct_rows_per_column(gadai_df):
+    df, col_mapping = gadai_df
+    # Baris 2 kini juga melanggar aturan jaminan & terbayar; total per kolom = baris unik
+    df.loc[2, col_mapping["jaminan"]] = -1
+    df.loc[2, col_mapping["terbayar"]] = -5
+
+    _, quality_report = validator.validate_data(df, col_mapping)
+
+    per_rule = quality_report[quality_report["tingkat"] == "aturan"].set_index("aturan")["jumlah_baris"]
+    per_column = quality_report[quality_report["tingkat"] == "kolom"].set_index("kolom")["jumlah_baris"]
+    assert per_rule["jaminan_nol"] == 2
+    assert per_column["jaminan"] == 2
+    assert per_column["tanggal_jt"] == 1
+    assert per_column["terbayar"] == 1
+    assert per_column.index.is_unique